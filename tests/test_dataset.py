@@ -0,0 +1,546 @@
+import os
+import sys
+import types
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import dataset
+from dataset import DatasetAnalyzer
+
+
+def test_batch_histograms_match_np_histogram():
+    rng = np.random.default_rng(1)
+    X = np.column_stack([rng.normal(size=1000), np.full(1000, 3.0), rng.random(1000)])
+    X[::7, 2] = np.nan
+    counts, edges = dataset._batch_histograms(X, bins=30)
+
+    for i in range(X.shape[1]):
+        col = X[:, i][~np.isnan(X[:, i])]
+        expected_counts, expected_edges = np.histogram(col, bins=30)
+        np.testing.assert_allclose(edges[i], expected_edges)
+        np.testing.assert_array_equal(counts[i], expected_counts)
+
+
+def test_batch_box_stats_match_matplotlib():
+    cbook = pytest.importorskip('matplotlib.cbook')
+    rng = np.random.default_rng(2)
+    X = np.column_stack([rng.standard_t(3, size=400), rng.exponential(size=400)])
+    X[::11, 1] = np.nan
+
+    for i, stats in enumerate(dataset._batch_box_stats(X)):
+        expected = cbook.boxplot_stats(X[:, i][~np.isnan(X[:, i])])[0]
+        for key in ('med', 'q1', 'q3', 'whislo', 'whishi'):
+            assert stats[key] == pytest.approx(expected[key])
+        np.testing.assert_allclose(np.sort(stats['fliers']), np.sort(expected['fliers']))
+
+
+@pytest.fixture
+def mixed_csv(tmp_path):
+    df = pd.DataFrame({
+        'id': range(20),
+        'price': np.linspace(1.0, 20.0, 20),
+        'city': ['paris', 'rome'] * 10,
+    })
+    path = tmp_path / 'mixed.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_load_csv_with_arrow_dtypes(mixed_csv):
+    pytest.importorskip('pyarrow')
+    analyzer = DatasetAnalyzer(str(mixed_csv))
+    assert analyzer.df.shape == (20, 3)
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in analyzer.df.dtypes)
+
+
+@pytest.mark.parametrize('use_arrow', [False, True])
+@pytest.mark.parametrize('options', [{'nrows': 5}, {'skipfooter': 15}, {'nrows': 5, 'low_memory': False}])
+def test_load_csv_with_c_engine_options(mixed_csv, use_arrow, options):
+    analyzer = DatasetAnalyzer(str(mixed_csv), use_arrow=use_arrow, **options)
+    assert analyzer.df.shape == (5, 3)
+    assert analyzer.df['id'].tolist() == list(range(5))
+
+
+def test_optimize_dtypes_keeps_integers_and_exact_floats(tmp_path):
+    path = tmp_path / 'dtypes.csv'
+    pd.DataFrame({
+        'age': [100, 120, 30, 45],
+        'qty': [90, 100, 3, 7],
+        'half': [0.5, 1.5, 2.0, 3.25],
+        'price': [0.1, 0.2, 0.3, 0.4],
+        'city': ['paris', 'paris', 'paris', 'rome'],
+    }).to_csv(path, index=False)
+
+    df = DatasetAnalyzer(str(path), use_arrow=False, category_threshold=0.6).df
+    assert df['age'].dtype == np.int64
+    assert (df['age'] + df['qty']).tolist() == [190, 220, 33, 52]
+    assert df['half'].dtype == np.float32
+    assert df['price'].dtype == np.float64
+    assert df['city'].dtype == 'category'
+
+
+def test_basic_info_cache_follows_the_frame(mixed_csv):
+    analyzer = DatasetAnalyzer(str(mixed_csv), use_arrow=False)
+    info = analyzer.get_basic_info()
+    assert info['shape'] == (20, 3)
+    assert info['missing_values'] == {'id': 0, 'price': 0, 'city': 0}
+
+    info['missing_values']['id'] = 99
+    assert analyzer.get_basic_info()['missing_values']['id'] == 0
+
+    analyzer.df = analyzer.df.head(10)
+    assert analyzer.get_basic_info()['shape'] == (10, 3)
+
+    analyzer.df.loc[0, 'price'] = np.nan
+    assert analyzer.get_basic_info()['missing_values']['price'] == 0
+    analyzer.clear_cache()
+    assert analyzer.get_basic_info()['missing_values']['price'] == 1
+
+    analyzer.load_data()
+    assert analyzer.get_basic_info()['shape'] == (20, 3)
+    assert analyzer._get_numeric_cols() == ['id', 'price']
+
+
+@pytest.fixture
+def numeric_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'a': rng.normal(size=500),
+        'b': rng.exponential(size=500),
+        'c': rng.integers(0, 100, size=500).astype(float),
+    })
+    df.loc[rng.choice(500, 40, replace=False), 'a'] = np.nan
+    df.loc[rng.choice(500, 25, replace=False), 'b'] = np.nan
+    df.loc[[3, 7], 'b'] = [50.0, -20.0]
+    path = tmp_path / 'numeric.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('strategy', ['mean', 'median'])
+def test_handle_missing_values_matches_fillna(numeric_csv, strategy):
+    analyzer = DatasetAnalyzer(str(numeric_csv), use_arrow=False)
+    numeric = analyzer.df.astype(float)
+    fill = numeric.mean() if strategy == 'mean' else numeric.median()
+    expected = numeric.fillna(fill)
+
+    result = analyzer.handle_missing_values(strategy).astype(float)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False)
+
+
+def test_handle_missing_values_fills_text_with_mode(tmp_path):
+    path = tmp_path / 'text.csv'
+    pd.DataFrame({'x': [1.0, None, 3.0, 4.0], 'city': ['rome', None, 'rome', 'paris']}).to_csv(
+        path, index=False)
+    analyzer = DatasetAnalyzer(str(path), use_arrow=False)
+
+    result = analyzer.handle_missing_values('mean')
+    assert result['x'].tolist() == pytest.approx([1.0, 8.0 / 3.0, 3.0, 4.0])
+    assert result['city'].astype(object).tolist() == ['rome', 'rome', 'rome', 'paris']
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'arrow'])
+def analyzer(request, numeric_csv):
+    if request.param:
+        pytest.importorskip('pyarrow')
+    return DatasetAnalyzer(str(numeric_csv), use_arrow=request.param)
+
+
+def _iqr_reference(series):
+    q1, q3 = series.quantile(0.25), series.quantile(0.75)
+    iqr = q3 - q1
+    return (series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)
+
+
+def test_get_outliers_all_matches_pandas(analyzer):
+    numeric = analyzer.df.astype(float)
+    iqr = analyzer.get_outliers_all('iqr')
+    zscore = analyzer.get_outliers_all('zscore')
+
+    for col in numeric.columns:
+        series = numeric[col]
+        np.testing.assert_array_equal(iqr[col].to_numpy(), _iqr_reference(series).to_numpy())
+        expected = ((series - series.mean()) / series.std()).abs() > 3
+        np.testing.assert_array_equal(zscore[col].to_numpy(), expected.to_numpy())
+
+
+def test_get_outliers_all_with_invalid_method(analyzer):
+    with pytest.raises(ValueError):
+        analyzer.get_outliers_all(method='invalid')
+
+
+def test_correlate_features_matches_pandas(tmp_path):
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=300)
+    df = pd.DataFrame({'x': x, 'y': 2 * x + rng.normal(size=300), 'z': rng.normal(size=300),
+                       'flat': np.ones(300)})
+    path = tmp_path / 'corr.csv'
+    df.to_csv(path, index=False)
+
+    analyzer = DatasetAnalyzer(str(path), use_arrow=False)
+    expected = analyzer.df.astype(float).corr()
+    pd.testing.assert_frame_equal(analyzer.correlate_features(), expected, check_exact=False)
+
+
+def test_correlate_features_with_gaps_matches_pandas(analyzer):
+    expected = analyzer.df.astype(float).corr()
+    pd.testing.assert_frame_equal(analyzer.correlate_features().astype(float), expected,
+                                  check_exact=False)
+
+
+def test_zscore_mask_matches_pandas():
+    rng = np.random.default_rng(4)
+    x = np.append(rng.normal(size=999), 25.0)
+    x[::13] = np.nan
+    series = pd.Series(x)
+    expected = ((series - series.mean()) / series.std()).abs() > 3
+
+    np.testing.assert_array_equal(dataset._zscore_mask(x), expected.to_numpy())
+
+
+def test_zscore_kernel_matches_numpy():
+    pytest.importorskip('numba')
+    rng = np.random.default_rng(5)
+    x = np.append(rng.normal(size=9999), [30.0, -30.0])
+    x[::17] = np.nan
+    out = np.empty(len(x), dtype=np.bool_)
+    dataset._get_zscore_kernel()(x, out, 3.0)
+
+    np.testing.assert_array_equal(out, dataset._zscore_mask_numpy(x))
+
+
+def test_zscore_kernel_used_above_row_threshold(monkeypatch):
+    pytest.importorskip('numba')
+    monkeypatch.setattr(dataset, '_NUMBA_MIN_ROWS', 10)
+    x = np.append(np.arange(100, dtype=np.float64), [np.nan, 1e4])
+
+    np.testing.assert_array_equal(dataset._zscore_mask(x), dataset._zscore_mask_numpy(x))
+
+
+def test_generate_report_reuses_cached_summaries(mixed_csv, tmp_path, monkeypatch):
+    analyzer = DatasetAnalyzer(str(mixed_csv), use_arrow=False)
+    calls = []
+    compute = analyzer._compute_basic_info
+    monkeypatch.setattr(analyzer, '_compute_basic_info', lambda: calls.append(1) or compute())
+
+    analyzer.get_basic_info()
+    analyzer.generate_report(str(tmp_path / 'report.txt'))
+    analyzer.generate_report(str(tmp_path / 'report.txt'))
+    assert len(calls) == 1
+    assert (tmp_path / 'report.txt').read_text().startswith('=' * 80)
+
+
+def _load_with_cache(path, capsys, **kwargs):
+    analyzer = DatasetAnalyzer(str(path), cache=True, **kwargs)
+    return analyzer, 'from cache' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('use_arrow', [False, True])
+def test_cache_hit_keeps_dtypes(mixed_csv, capsys, use_arrow):
+    pytest.importorskip('pyarrow')
+    first, hit = _load_with_cache(mixed_csv, capsys, use_arrow=use_arrow)
+    assert not hit
+    second, hit = _load_with_cache(mixed_csv, capsys, use_arrow=use_arrow)
+    assert hit
+    pd.testing.assert_frame_equal(second.df, first.df)
+
+
+def test_cache_is_stale_after_source_changes(mixed_csv, capsys):
+    pytest.importorskip('pyarrow')
+    _load_with_cache(mixed_csv, capsys)
+    pd.DataFrame({'id': [1], 'price': [2.0], 'city': ['oslo']}).to_csv(mixed_csv, index=False)
+    future = os.path.getmtime(str(mixed_csv) + '.cache.parquet') + 10
+    os.utime(mixed_csv, (future, future))
+
+    analyzer, hit = _load_with_cache(mixed_csv, capsys)
+    assert not hit
+    assert analyzer.df.shape == (1, 3)
+
+
+def test_cache_is_stale_under_other_settings(mixed_csv, capsys):
+    pytest.importorskip('pyarrow')
+    _load_with_cache(mixed_csv, capsys, use_arrow=False)
+    analyzer, hit = _load_with_cache(mixed_csv, capsys, use_arrow=False, category_threshold=0.01)
+    assert not hit
+    assert analyzer.df['city'].dtype != 'category'
+    _, hit = _load_with_cache(mixed_csv, capsys, use_arrow=True, category_threshold=0.01)
+    assert not hit
+
+
+def test_corrupt_cache_is_a_miss(mixed_csv, capsys):
+    pytest.importorskip('pyarrow')
+    cache_path = str(mixed_csv) + '.cache.parquet'
+    with open(cache_path, 'wb') as f:
+        f.write(b'not a parquet file')
+
+    analyzer, hit = _load_with_cache(mixed_csv, capsys)
+    assert not hit
+    assert analyzer.df.shape == (20, 3)
+    _, hit = _load_with_cache(mixed_csv, capsys)
+    assert hit
+    assert [name for name in os.listdir(os.path.dirname(cache_path)) if name.endswith('.tmp')] == []
+
+
+@pytest.fixture
+def fake_cudf(monkeypatch):
+    """Stand-in cudf module backed by pandas, to run the cuDF branches without a GPU."""
+    module = types.ModuleType('cudf')
+    module.read_csv = pd.read_csv
+    module.read_parquet = pd.read_parquet
+    module.from_pandas = lambda df: df.copy()
+    monkeypatch.setitem(sys.modules, 'cudf', module)
+    return module
+
+
+def test_cudf_backend_matches_pandas(numeric_csv, fake_cudf):
+    gpu = DatasetAnalyzer(str(numeric_csv), backend='cudf')
+    cpu = DatasetAnalyzer(str(numeric_csv), use_arrow=False)
+
+    assert gpu.get_basic_info()['missing_values'] == cpu.get_basic_info()['missing_values']
+    assert gpu.get_basic_info()['duplicates'] == cpu.get_basic_info()['duplicates']
+    for method in ('iqr', 'zscore'):
+        np.testing.assert_array_equal(gpu.get_outliers_all(method).to_numpy(),
+                                      cpu.get_outliers_all(method).to_numpy())
+        np.testing.assert_array_equal(gpu.get_outliers('b', method).to_numpy(),
+                                      cpu.get_outliers('b', method).to_numpy())
+    pd.testing.assert_frame_equal(gpu.correlate_features(), cpu.correlate_features().astype(float),
+                                  check_exact=False)
+
+
+def test_unknown_backend_is_rejected(numeric_csv):
+    with pytest.raises(ValueError):
+        DatasetAnalyzer(str(numeric_csv), backend='dask')
+
+
+@pytest.mark.parametrize('frame', [
+    pd.DataFrame({'a': [0.0, -0.0, np.nan, np.nan, 1.0, 1.0, 2.0],
+                  'b': ['x', 'x', 'y', 'y', 'z', 'z', 'z']}),
+    pd.DataFrame([[1, 2], [2, 1], [1, 2]], columns=['a', 'a']),
+    pd.DataFrame({'a': [1, '1']}, dtype=object),
+    pd.DataFrame({'a': [np.nan, None]}, dtype=object),
+    pd.DataFrame({'a': [1, '1', 1.0, None, np.nan], 'b': ['x'] * 5}, dtype=object),
+    pd.DataFrame({'a': pd.Categorical(['1', '1', 'x']), 'b': [1, 1, 1]}),
+], ids=['signed-zeros', 'same-names', 'int-vs-str', 'nan-vs-none', 'mixed-objects', 'category'])
+def test_count_duplicates_matches_duplicated(frame):
+    assert dataset._count_duplicates(frame) == frame.duplicated().sum()
+
+
+@pytest.mark.parametrize('strategy', ['mean', 'median', 'drop'])
+def test_cudf_handle_missing_values_matches_pandas(tmp_path, fake_cudf, strategy):
+    path = tmp_path / 'gaps.csv'
+    pd.DataFrame({'x': [1.0, None, 3.0, 10.0], 'mostly_empty': [None, None, None, 1.0],
+                  'city': ['rome', None, 'rome', 'paris']}).to_csv(path, index=False)
+    gpu = DatasetAnalyzer(str(path), backend='cudf')
+    cpu = DatasetAnalyzer(str(path), use_arrow=False)
+
+    result = gpu.handle_missing_values(strategy)
+    expected = cpu.handle_missing_values(strategy)
+    assert result.columns.tolist() == ['x', 'city']
+    np.testing.assert_allclose(result['x'].astype(float), expected['x'].astype(float))
+    assert result['city'].astype(object).tolist() == expected['city'].astype(object).tolist()
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    pa = pytest.importorskip('pyarrow')
+    table = pa.table({'year': list(range(2010, 2030)), 'value': np.arange(20.0), 'extra': ['e'] * 20})
+    path = tmp_path / 'data.parquet'
+    pq.write_table(table, path, row_group_size=5)
+    return path
+
+
+@pytest.mark.parametrize('use_arrow', [False, True])
+def test_parquet_projection(parquet_file, use_arrow):
+    analyzer = DatasetAnalyzer(str(parquet_file), use_arrow=use_arrow, columns=['year', 'value'])
+    assert analyzer.df.columns.tolist() == ['year', 'value']
+    assert len(analyzer.df) == 20
+
+    analyzer.load_data(columns=['value'], row_groups=[1, 3])
+    assert analyzer.df['value'].tolist() == [5.0, 6.0, 7.0, 8.0, 9.0, 15.0, 16.0, 17.0, 18.0, 19.0]
+
+    analyzer.load_data(filters=[('year', '>=', 2025)])
+    assert analyzer.df['year'].tolist() == list(range(2025, 2030))
+
+
+def test_csv_projection(mixed_csv):
+    analyzer = DatasetAnalyzer(str(mixed_csv), columns=['id', 'city'])
+    assert analyzer.df.columns.tolist() == ['id', 'city']
+
+
+def test_projection_rejects_unsupported_combinations(mixed_csv, parquet_file):
+    with pytest.raises(ValueError):
+        DatasetAnalyzer(str(mixed_csv), row_groups=[0])
+    with pytest.raises(ValueError):
+        DatasetAnalyzer(str(mixed_csv), filters=[('id', '>', 3)])
+    with pytest.raises(ValueError):
+        DatasetAnalyzer(str(parquet_file), row_groups=[0], filters=[('year', '>', 2012)])
+
+
+def test_get_outliers_iqr_matches_quantile(analyzer):
+    for col in analyzer.df.columns:
+        expected = _iqr_reference(analyzer.df[col].astype(float))
+        np.testing.assert_array_equal(analyzer.get_outliers(col).to_numpy(), expected.to_numpy())
+
+
+def test_iqr_mask_ignores_nans():
+    x = np.array([np.nan, 1.0, 2.0, 3.0, 4.0, 100.0, np.nan])
+    np.testing.assert_array_equal(dataset._iqr_mask(x), [False] * 5 + [True, False])
+    assert not dataset._iqr_mask(np.full(3, np.nan)).any()
+
+
+def test_generate_report_lists_columns_and_missing_values(tmp_path):
+    path = tmp_path / 'gaps.csv'
+    pd.DataFrame({'x': [1.0, None, 3.0, 4.0], 'city': ['rome', None, None, 'paris']}).to_csv(
+        path, index=False)
+    analyzer = DatasetAnalyzer(str(path), use_arrow=False)
+    report = tmp_path / 'report.txt'
+    analyzer.generate_report(str(report))
+
+    text = report.read_text()
+    assert f"Dataset: {path}\n" in text
+    assert "Shape: 4 rows × 2 columns\n" in text
+    assert "COLUMNS:\n  - x\n  - city\n" in text
+    assert "MISSING VALUES:\n  x: 1 (25.00%)\n  city: 2 (50.00%)\n" in text
+    assert text.endswith(analyzer.df.describe().to_string())
+
+
+@pytest.mark.parametrize('use_arrow', [False, True])
+def test_type_inference_notes_numeric_text(tmp_path, capsys, use_arrow):
+    if use_arrow:
+        pytest.importorskip('pyarrow')
+    values = [str(i) for i in range(100)]
+    values[::10] = ['x'] * 10
+    path = tmp_path / 'numbers.csv'
+    pd.DataFrame({'n': values, 'word': ['abc', 'de'] * 50, 'f': np.arange(100.0)}).to_csv(
+        path, index=False)
+
+    DatasetAnalyzer(str(path), use_arrow=use_arrow)
+    notes = [line for line in capsys.readouterr().out.splitlines() if line.startswith('!')]
+    assert len(notes) == 1
+    assert notes[0].startswith("! Column 'n' read as ")
+    assert 'values look numeric' in notes[0]
+
+
+def test_type_inference_notes_object_columns_and_dtype_warnings(mixed_csv, capsys):
+    analyzer = DatasetAnalyzer(str(mixed_csv), use_arrow=False)
+    analyzer.df = pd.DataFrame({'mixed': [1, 'a'], 'floats': pd.Series([1.5, 2.5], dtype=object),
+                                'word': ['abc', 'de']})
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        warnings.warn("Columns (0) have mixed types.", pd.errors.DtypeWarning)
+    capsys.readouterr()
+
+    analyzer._report_type_inference(caught)
+    notes = capsys.readouterr().out.splitlines()
+    assert notes == [
+        "! Column 'mixed' read as object (mixed types); specify dtype= to accelerate loading",
+        "! Column 'floats' read as object (values look like floating); specify dtype= to accelerate loading",
+    ]
+
+
+def test_display_summary_samples_large_frames(numeric_csv, capsys):
+    analyzer = DatasetAnalyzer(str(numeric_csv), use_arrow=False)
+    capsys.readouterr()
+
+    analyzer.display_summary(sample_n=100)
+    out = capsys.readouterr().out
+    assert 'STATISTICAL SUMMARY (approx., 100 sampled rows)' in out
+    assert analyzer.df.sample(100, random_state=0).describe().to_string() in out
+
+    analyzer.display_summary(sample_n=None)
+    out = capsys.readouterr().out
+    assert 'approx.' not in out
+    assert analyzer.df.describe().to_string() in out
+
+
+@pytest.mark.parametrize('strategy', ['mean', 'median'])
+def test_arrow_handle_missing_values_matches_fillna(numeric_csv, strategy):
+    pytest.importorskip('pyarrow')
+    analyzer = DatasetAnalyzer(str(numeric_csv), use_arrow=True)
+    numeric = analyzer.df.astype(float)
+    fill = numeric.mean() if strategy == 'mean' else numeric.median()
+
+    result = analyzer.handle_missing_values(strategy)
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    pd.testing.assert_frame_equal(result.astype(float), numeric.fillna(fill), check_exact=False)
+
+
+def _arrow_frame_with_gaps(analyzer, extra_types=()):
+    pa = pytest.importorskip('pyarrow')
+    columns = {
+        'x': pa.array([1.0, None, 3.0, 4.0]),
+        'flag': pa.array([True, None, True, False]),
+        'city': pa.array(['rome', None, 'rome', 'paris']),
+        'code': pa.array(['a', None, 'a', 'b']).dictionary_encode(),
+    }
+    for name, arrow_type in extra_types:
+        columns[name] = columns['city'].cast(arrow_type)
+    analyzer.df = pa.table(columns).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def test_arrow_handle_missing_values_fills_mode_columns(mixed_csv):
+    pa = pytest.importorskip('pyarrow')
+    analyzer = DatasetAnalyzer(str(mixed_csv))
+    views = [('view', pa.string_view())] if hasattr(pa, 'string_view') else []
+    _arrow_frame_with_gaps(analyzer, views)
+
+    result = analyzer.handle_missing_values('mean')
+    assert result['x'].tolist() == pytest.approx([1.0, 8.0 / 3.0, 3.0, 4.0])
+    assert result['flag'].tolist() == [True, True, True, False]
+    assert result['city'].tolist() == ['rome', 'rome', 'rome', 'paris']
+    assert result['code'].astype(str).tolist() == ['a', 'a', 'a', 'b']
+    for name, arrow_type in views:
+        assert result[name].tolist() == ['rome', 'rome', 'rome', 'paris']
+        assert result[name].dtype == pd.ArrowDtype(arrow_type)
+
+
+def test_arrow_handle_missing_values_falls_back_for_other_types(mixed_csv):
+    pa = pytest.importorskip('pyarrow')
+    analyzer = DatasetAnalyzer(str(mixed_csv))
+    analyzer.df = pa.table({
+        'x': pa.array([1.0, None, 3.0]),
+        'when': pa.array([1, None, 3], type=pa.timestamp('s')),
+    }).to_pandas(types_mapper=pd.ArrowDtype)
+
+    result = analyzer.handle_missing_values('mean')
+    assert result['x'].tolist() == pytest.approx([1.0, 2.0, 3.0])
+
+
+def test_use_threads_only_for_large_blocks():
+    if dataset.Parallel is None:
+        pytest.skip('joblib is not installed')
+    assert not dataset._use_threads(1, 10_000_000, 20)
+    assert not dataset._use_threads(-1, 10_000, 20)
+    assert not dataset._use_threads(-1, 10_000_000, 1)
+    assert dataset._use_threads(-1, 1_000_000, 5)
+
+
+@pytest.mark.parametrize('strategy', ['mean', 'median'])
+def test_threaded_paths_match_serial(analyzer, monkeypatch, strategy):
+    serial_fill = analyzer.handle_missing_values(strategy)
+    serial_iqr = analyzer.get_outliers_all('iqr')
+
+    monkeypatch.setattr(dataset, '_PARALLEL_MIN_CELLS', 1)
+    analyzer.n_jobs = 2
+    pd.testing.assert_frame_equal(analyzer.handle_missing_values(strategy), serial_fill)
+    pd.testing.assert_frame_equal(analyzer.get_outliers_all('iqr'), serial_iqr)
+
+
+def test_memory_estimate_is_close_to_deep_usage(mixed_csv):
+    rng = np.random.default_rng(6)
+    n = 50_000
+    labels = [f'label-{i}' * 5 for i in rng.integers(0, 20_000, n)]
+    analyzer = DatasetAnalyzer(str(mixed_csv), use_arrow=False)
+    analyzer.df = pd.DataFrame({
+        'text': pd.Series(['x' * k for k in np.sort(rng.integers(1, 60, n))], dtype=object),
+        'label': pd.Categorical(labels, categories=pd.Index(np.unique(labels), dtype=object)),
+        'value': rng.random(n),
+    })
+
+    exact = analyzer.df.memory_usage(deep=True).sum() / 1024**2
+    assert analyzer._memory_usage_mb() == pytest.approx(exact, rel=0.02)
+    assert analyzer.get_basic_info()['memory_usage'] == pytest.approx(exact, rel=0.02)